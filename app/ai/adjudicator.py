@@ -1,3 +1,4 @@
+import asyncio
 from typing import List, Dict
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
@@ -63,6 +64,9 @@ adjudication_chain = (
     | reasoning_model
 )
 
+# Caps in-flight adjudication calls across concurrent requests to stay under rate limits
+_LLM_SEMAPHORE = asyncio.Semaphore(settings.MAX_CONCURRENT_LLM_CALLS)
+
 
 async def adjudicate_claims(adjudication_input: AdjudicationInput) -> FactCheckResult:
     """
@@ -73,35 +77,50 @@ async def adjudicate_claims(adjudication_input: AdjudicationInput) -> FactCheckR
         
     Returns:
         FactCheckResult with analysis text
-    """
-    try:
-        # Format claims for the prompt
-        claims_text = _format_claims_for_prompt(adjudication_input.enriched_claims)
-        
-        # Format evidence for the prompt
-        evidence_text = _format_evidence_for_prompt(adjudication_input.evidence_map)
         
-        # Invoke the adjudication chain
+    Raises:
+        Exception: If the LLM call fails, so the pipeline answers with an error
+        verdict instead of presenting the failure as an analysis
+    """
+    # Format claims for the prompt
+    claims_text = _format_claims_for_prompt(adjudication_input.enriched_claims)
+    
+    # Format evidence for the prompt
+    evidence_text = _format_evidence_for_prompt(adjudication_input.evidence_map)
+    
+    # Invoke the adjudication chain
+    async with _LLM_SEMAPHORE:
         response = await adjudication_chain.ainvoke({
             "original_query": adjudication_input.original_user_text,
             "claims_text": claims_text,
             "evidence_text": evidence_text
         })
-        
-        # Extract text content from response
-        analysis_text = response.content if hasattr(response, 'content') else str(response)
-        
-        return FactCheckResult(
-            original_query=adjudication_input.original_user_text,
-            analysis_text=analysis_text
-        )
-        
-    except Exception as e:
-        # Fallback to unverifiable with error explanation
-        return FactCheckResult(
-            original_query=adjudication_input.original_user_text,
-            analysis_text=f"Erro durante processamento: {str(e)}. Não foi possível completar a análise."
-        )
+    
+    # Extract text content from response
+    analysis_text = response.content if hasattr(response, 'content') else str(response)
+    
+    return FactCheckResult(
+        original_query=adjudication_input.original_user_text,
+        analysis_text=analysis_text
+    )
+
+
+def _dedupe_citations(citations: List[Citation]) -> List[Citation]:
+    """
+    Drop repeats of the same source and quote, keeping the API's relevance order,
+    so duplicate fact-checks don't take up prompt tokens.
+    """
+    unique_citations = []
+    seen = set()
+    for citation in citations:
+        # Keyed on the url too: fact-check quotes are templated ("Fact-check verdict: Falso...")
+        # and identical across publishers that rated the same claim
+        key = (citation.url, " ".join(citation.quoted.lower().split()))
+        if key in seen:
+            continue
+        seen.add(key)
+        unique_citations.append(citation)
+    return unique_citations
 
 
 def _format_claims_for_prompt(claims: List[EnrichedClaim]) -> str:
@@ -147,9 +166,10 @@ def _format_evidence_for_prompt(evidence_map: Dict[str, ClaimEvidence]) -> str:
         evidence_text = f"\n**EVIDÊNCIAS PARA**: {claim_text}\n"
         evidence_text += f"**Consultas utilizadas**: {', '.join(evidence.search_queries)}\n"
         
-        if evidence.citations:
+        citations = _dedupe_citations(evidence.citations)
+        if citations:
             evidence_text += "**Fontes encontradas**:\n"
-            for i, citation in enumerate(evidence.citations, 1):
+            for i, citation in enumerate(citations, 1):
                 evidence_text += f"  {i}. **{citation.title}** ({citation.publisher})\n"
                 evidence_text += f"     URL: {citation.url}\n"
                 if citation.quoted:
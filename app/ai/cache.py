@@ -0,0 +1,88 @@
+"""
+In-process LRU + TTL caches
+
+TTLCache is the one cache implementation shared by the pipeline: Google Fact-Check
+citations per claim, link extractions per URL and finished analyses per message.
+
+Fact-check requests repeat a lot (the same forwarded message reaches many users),
+and each full pipeline run costs several seconds of LLM and search calls.
+Finished AnalysisResponse objects are kept in a ResponseCache, keyed by the
+SHA-256 of the normalized text and locale, so repeats return immediately.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Generic, Optional, Tuple, TypeVar
+
+from app.models.schemas import AnalysisResponse
+from app.core.config import get_settings
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    LRU + TTL cache with hit/miss counters.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: int = 3600):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, V]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[V]:
+        """Return the cached value, or None on miss/expiry"""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: str, value: V) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        """Counters exposed on /health"""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+class ResponseCache(TTLCache[AnalysisResponse]):
+    """
+    TTLCache of AnalysisResponse objects keyed by the normalized request text.
+    """
+
+    @staticmethod
+    def make_key(text: str, locale: str = "pt-BR") -> str:
+        """Hash the text with casing and whitespace normalized, plus its locale"""
+        normalized = " ".join(text.lower().split())
+        return hashlib.sha256(f"{locale}\n{normalized}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[AnalysisResponse]:
+        """Return a copy of the cached response, or None on miss/expiry"""
+        response = super().get(key)
+        if response is None:
+            return None
+        # Served without running the pipeline
+        return response.model_copy(update={"processing_time_ms": 0})
+
+
+@lru_cache()
+def get_response_cache() -> ResponseCache:
+    settings = get_settings()
+    return ResponseCache(
+        max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS
+    )
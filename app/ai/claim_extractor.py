@@ -12,11 +12,12 @@ Following LangChain best practices:
 - Portuguese (pt-BR) language support
 """
 
+import asyncio
+from functools import lru_cache
 from typing import List
 import re
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.exceptions import OutputParserException
 
 from app.models.factchecking import (
     UserInput,
@@ -26,6 +27,12 @@ from app.core.config import get_settings
 
 settings = get_settings()
 
+# Caps in-flight extraction calls across concurrent requests to stay under rate limits
+_LLM_SEMAPHORE = asyncio.Semaphore(settings.MAX_CONCURRENT_LLM_CALLS)
+
+# Compiled once at import instead of on every request
+_URL_RE = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+
 
 class ClaimExtractor:
     """
@@ -139,9 +146,7 @@ Se não houver alegações verificáveis, retorne uma lista vazia mas explique o
         Extract URLs from text using regex.
         Helper method following separation of concerns principle.
         """
-        url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-        urls = re.findall(url_pattern, text)
-        return urls
+        return _URL_RE.findall(text)
 
     async def extract_claims(self, user_input: UserInput) -> ClaimExtractionResult:
         """
@@ -155,59 +160,44 @@ Se não houver alegações verificáveis, retorne uma lista vazia mas explique o
 
         Raises:
             OutputParserException: If LLM output doesn't match expected schema
-            Exception: For other processing errors
+            Exception: For other processing errors (e.g. the LLM call failing)
         """
-        try:
-            # Extract URLs from original text for inclusion in claims
-            extracted_urls = self._extract_urls_from_text(user_input.text)
+        # Extract URLs from original text for inclusion in claims
+        extracted_urls = self._extract_urls_from_text(user_input.text)
 
-            # Prepare input for the chain following stateless design
-            chain_input = {
-                "text": user_input.text,
-                "context": user_input.context or "Nenhum contexto adicional fornecido."
-            }
+        # Prepare input for the chain following stateless design
+        chain_input = {
+            "text": user_input.text,
+            "context": user_input.context or "Nenhum contexto adicional fornecido."
+        }
 
-            # Call LLM chain using async invoke following best practices
+        # Call LLM chain using async invoke following best practices
+        async with _LLM_SEMAPHORE:
             result = await self.chain.ainvoke(chain_input)
 
-            # Post-process to ensure URLs are included in claims
-            for claim in result.claims:
-                if not claim.links and extracted_urls:
-                    # Add URLs to claims that don't have any
-                    claim.links = extracted_urls
-
-            # Validate that we have meaningful output
-            if not result.claims:
-                result.processing_notes = (
-                    "Nenhuma alegação verificável encontrada no texto. "
-                    "O texto pode conter apenas perguntas, opiniões ou especulações."
-                )
-
-            return result
-
-        except OutputParserException as e:
-            # Handle structured output parsing errors
-            fallback_result = ClaimExtractionResult(
-                original_text=user_input.text,
-                claims=[],
-                processing_notes=f"Erro ao processar resposta do LLM: {str(e)}"
+        # Post-process to ensure URLs are included in claims
+        for claim in result.claims:
+            if not claim.links and extracted_urls:
+                # Add URLs to claims that don't have any
+                claim.links = extracted_urls
+
+        # Validate that we have meaningful output
+        if not result.claims:
+            result.processing_notes = (
+                "Nenhuma alegação verificável encontrada no texto. "
+                "O texto pode conter apenas perguntas, opiniões ou especulações."
             )
-            return fallback_result
-
-        except Exception as e:
-            # Handle other errors gracefully
-            fallback_result = ClaimExtractionResult(
-                original_text=user_input.text,
-                claims=[],
-                processing_notes=f"Erro durante extração de alegações: {str(e)}"
-            )
-            return fallback_result
+
+        return result
 
 
 # Factory function following LangChain best practices
+@lru_cache()
 def create_claim_extractor(model_name: str = "gpt-4o") -> ClaimExtractor:
     """
     Factory function to create a ClaimExtractor instance.
+    The extractor is stateless, so one instance per model is cached and reused
+    across requests (keeps the chain and the OpenAI client connection pool alive).
 
     Args:
         model_name: OpenAI model name to use
@@ -7,17 +7,21 @@ Takes ClaimExtractionResult from Step 2 and retrieves fact-check evidence for ea
 Outputs structured data models for Step 4 (Adjudication).
 """
 
-import requests
-from typing import List, Optional
+import asyncio
+import httpx
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 import logging
 
 from app.models.factchecking import (
     LinkEnrichmentResult,
+    EnrichedClaim,
     Citation,
     ClaimEvidence,
     EvidenceRetrievalResult
 )
 from app.core.config import get_settings
+from app.core.http import get_http_client
+from app.ai.cache import TTLCache
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -25,6 +29,24 @@ logger = logging.getLogger(__name__)
 # Initialize settings
 settings = get_settings()
 
+# In-process cache of Google Fact-Check results keyed by normalized claim text.
+# Fact-checks are rarely hour-fresh, so entries live for 24h.
+CITATION_CACHE_TTL_SECONDS = 24 * 60 * 60
+CITATION_CACHE_MAX_ENTRIES = 1024
+_citation_cache: TTLCache[List[Citation]] = TTLCache(
+    max_entries=CITATION_CACHE_MAX_ENTRIES,
+    ttl_seconds=CITATION_CACHE_TTL_SECONDS
+)
+
+# Claims are looked up in parallel, capped so a long message doesn't trip the API's 429s
+GOOGLE_API_CONCURRENCY = 5
+_GOOGLE_API_SEMAPHORE = asyncio.Semaphore(GOOGLE_API_CONCURRENCY)
+
+
+def _normalize_claim_text(claim_text: str) -> str:
+    """Normalize claim text so casing/whitespace variants share a cache entry"""
+    return " ".join(claim_text.lower().split())
+
 
 class GoogleFactCheckRetriever:
     """
@@ -35,7 +57,7 @@ class GoogleFactCheckRetriever:
         self.api_key = settings.GOOGLE_API_KEY
         self.base_url = "https://factchecktools.googleapis.com/v1alpha1/claims:search"
         
-    async def search_claim(self, claim_text: str) -> List[Citation]:
+    async def search_claim(self, claim_text: str) -> Optional[List[Citation]]:
         """
         Search for fact-check evidence for a single claim
         
@@ -43,18 +65,21 @@ class GoogleFactCheckRetriever:
             claim_text: The claim to search for
             
         Returns:
-            List of Citation objects from fact-checkers
+            List of Citation objects from fact-checkers, or None if the lookup failed
+            (so a failure isn't mistaken for "no fact-checks found")
         """
         if not self.api_key:
             logger.warning("Google API key not configured")
             return []
             
         try:
-            # Build request URL
-            url = f"{self.base_url}?query={claim_text}&key={self.api_key}"
-            
-            # Make API request
-            response = requests.get(url, timeout=10)
+            # Make API request over the shared pooled client
+            client = get_http_client()
+            async with _GOOGLE_API_SEMAPHORE:
+                response = await client.get(
+                    self.base_url,
+                    params={"query": claim_text, "key": self.api_key}
+                )
             response.raise_for_status()
             
             # Parse response
@@ -73,12 +98,12 @@ class GoogleFactCheckRetriever:
             logger.info(f"Found {len(citations)} fact-check results for claim: {claim_text[:50]}...")
             return citations
             
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Google API request failed: {e}")
-            return []
+            return None
         except Exception as e:
             logger.error(f"Error processing Google API response: {e}")
-            return []
+            return None
     
     def _parse_claim_review(self, claim: dict, review: dict) -> Optional[Citation]:
         """
@@ -117,42 +142,97 @@ class GoogleFactCheckRetriever:
             return None
 
 
-async def retrieve_evidence_from_enriched(enrichment_result: LinkEnrichmentResult) -> EvidenceRetrievalResult:
+def _build_claim_evidence(enriched_claim: EnrichedClaim, citations: Optional[List[Citation]]) -> ClaimEvidence:
     """
-    Evidence retrieval function that works with enriched claims from Step 2.5
+    Create ClaimEvidence that includes BOTH:
+    1. External evidence (Google Fact-Check citations; None if the lookup failed)
+    2. Enriched links (user-provided URL content from Step 2.5)
+    """
+    lookup_failed = citations is None
+    citations = citations or []
+    google_notes = "lookup failed" if lookup_failed else f"{len(citations)} external sources"
+    return ClaimEvidence(
+        claim_text=enriched_claim.text,
+        citations=citations,  # External evidence from Google API
+        search_queries=[f"Google Fact-Check for: {enriched_claim.text}"],
+        enriched_links=enriched_claim.enriched_links,  # Propagated enriched content
+        retrieval_notes=f"Google API: {google_notes}. User links: {len(enriched_claim.enriched_links)} enriched.",
+        lookup_failed=lookup_failed
+    )
+
+
+async def stream_evidence_from_enriched(enrichment_result: LinkEnrichmentResult) -> AsyncIterator[ClaimEvidence]:
+    """
+    Yield each claim's evidence as soon as its lookup resolves.
     
-    Simply propagates enriched link data forward while doing normal Google API evidence retrieval.
+    Cached claims come out first; the Google API misses are searched concurrently
+    and yielded in completion order. Claims with the same text are yielded once.
     
     Args:
         enrichment_result: Output from Step 2.5 (Link Enrichment)
         
-    Returns:
-        EvidenceRetrievalResult: External evidence + enriched link content for Step 4 (Adjudication)
+    Yields:
+        ClaimEvidence per unique claim text
     """
     retriever = GoogleFactCheckRetriever()
-    evidence_map = {}
-    total_sources_found = 0
     
-    # Process each enriched claim - same logic as before, just different input structure
+    # Look up the cache first; only unique misses are sent to the Google API
+    claims_by_key: Dict[str, List[EnrichedClaim]] = {}
     for enriched_claim in enrichment_result.enriched_claims:
-        logger.info(f"Retrieving evidence for claim: {enriched_claim.text}")
-        
-        # Use the SAME Google Fact-Check search logic as before
-        citations = await retriever.search_claim(enriched_claim.text)
-        
-        # Create ClaimEvidence that includes BOTH:
-        # 1. External evidence (Google Fact-Check citations)
-        # 2. Enriched links (user-provided URL content from Step 2.5)
-        claim_evidence = ClaimEvidence(
-            claim_text=enriched_claim.text,
-            citations=citations,  # External evidence from Google API
-            search_queries=[f"Google Fact-Check for: {enriched_claim.text}"],
-            enriched_links=enriched_claim.enriched_links,  # Propagated enriched content
-            retrieval_notes=f"Google API: {len(citations)} external sources. User links: {len(enriched_claim.enriched_links)} enriched."
-        )
+        claims_by_key.setdefault(_normalize_claim_text(enriched_claim.text), []).append(enriched_claim)
+    
+    cached_by_key: Dict[str, List[Citation]] = {}
+    misses: List[str] = []
+    for key, claims in claims_by_key.items():
+        cached = _citation_cache.get(key)
+        if cached is not None:
+            logger.info(f"Using cached evidence for claim: {claims[0].text}")
+            cached_by_key[key] = cached
+        else:
+            logger.info(f"Retrieving evidence for claim: {claims[0].text}")
+            misses.append(key)
+    
+    async def search(key: str) -> Tuple[str, Optional[List[Citation]]]:
+        return key, await retriever.search_claim(claims_by_key[key][0].text)
+    
+    # All misses are searched concurrently instead of one round trip per claim
+    tasks = [asyncio.ensure_future(search(key)) for key in misses]
+    seen_texts = set()
+    
+    def evidence_for(key: str, citations: Optional[List[Citation]]) -> List[ClaimEvidence]:
+        evidence = []
+        for enriched_claim in claims_by_key[key]:
+            if enriched_claim.text not in seen_texts:
+                seen_texts.add(enriched_claim.text)
+                evidence.append(_build_claim_evidence(enriched_claim, citations))
+        return evidence
+    
+    try:
+        for key, citations in cached_by_key.items():
+            for claim_evidence in evidence_for(key, citations):
+                yield claim_evidence
         
+        for next_done in asyncio.as_completed(tasks):
+            key, citations = await next_done
+            # Failed lookups (None) and empty results aren't cached
+            if citations:
+                _citation_cache.set(key, list(citations))
+            for claim_evidence in evidence_for(key, citations):
+                yield claim_evidence
+    finally:
+        # The consumer may stop early (client disconnected); don't leave searches running
+        for task in tasks:
+            task.cancel()
+
+
+def build_evidence_result(enrichment_result: LinkEnrichmentResult, evidence_by_text: Dict[str, ClaimEvidence]) -> EvidenceRetrievalResult:
+    """Assemble the Step 3 result, in claim order, from the evidence yielded per claim"""
+    evidence_map = {}
+    total_sources_found = 0
+    for enriched_claim in enrichment_result.enriched_claims:
+        claim_evidence = evidence_by_text[enriched_claim.text]
         evidence_map[enriched_claim.text] = claim_evidence
-        total_sources_found += len(citations)
+        total_sources_found += len(claim_evidence.citations)
     
     return EvidenceRetrievalResult(
         claim_evidence_map=evidence_map,
@@ -161,3 +241,22 @@ async def retrieve_evidence_from_enriched(enrichment_result: LinkEnrichmentResul
     )
 
 
+async def retrieve_evidence_from_enriched(enrichment_result: LinkEnrichmentResult) -> EvidenceRetrievalResult:
+    """
+    Evidence retrieval function that works with enriched claims from Step 2.5
+    
+    Simply propagates enriched link data forward while doing normal Google API evidence retrieval.
+    
+    Args:
+        enrichment_result: Output from Step 2.5 (Link Enrichment)
+        
+    Returns:
+        EvidenceRetrievalResult: External evidence + enriched link content for Step 4 (Adjudication)
+    """
+    evidence_by_text = {
+        claim_evidence.claim_text: claim_evidence
+        async for claim_evidence in stream_evidence_from_enriched(enrichment_result)
+    }
+    return build_evidence_result(enrichment_result, evidence_by_text)
+
+
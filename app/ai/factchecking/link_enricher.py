@@ -12,12 +12,22 @@ Follows LangChain best practices:
 """
 
 import asyncio
+import atexit
+import hashlib
+import queue
+import threading
 import time
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from typing import AsyncIterator, Dict, List
 import logging
 import re
 import random
 import requests
 import os
+import shutil
+import subprocess
+from http.cookiejar import DefaultCookiePolicy
 from bs4 import BeautifulSoup
 
 from newspaper import Article, Config
@@ -46,9 +56,65 @@ from app.models.factchecking import (
     EnrichedClaim,
     LinkEnrichmentResult
 )
+from app.core.config import get_settings
+from app.ai.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+settings = get_settings()
+
+# BeautifulSoup backend for the fallback extractors: lxml's C parser (already a
+# dependency via newspaper3k/readability) is several times faster than html.parser
+_HTML_PARSER = "lxml"
+
+# One requests.Session per executor thread for the plain HTTP fallbacks, so repeated
+# hits to the same host reuse keep-alive connections instead of a new TCP/TLS
+# handshake per call. requests doesn't guarantee a Session is thread-safe, and up to
+# LINK_ENRICHMENT_CONCURRENCY extractions run at once, so sessions aren't shared.
+_HTTP_SESSIONS = threading.local()
+
+
+def _get_http_session() -> requests.Session:
+    """Return this thread's session, creating it on first use"""
+    session = getattr(_HTTP_SESSIONS, "session", None)
+    if session is None:
+        session = requests.Session()
+        # Cookies are refused to keep these fetches stateless, as a bare requests.get was
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        _HTTP_SESSIONS.session = session
+    return session
+
+# Caps concurrent URL extractions (each one occupies an executor thread) across requests
+_EXTRACTION_SEMAPHORE = asyncio.Semaphore(settings.LINK_ENRICHMENT_CONCURRENCY)
+
+# In-process cache of successful extractions keyed by URL hash, so the same links
+# shared across messages aren't scraped again for 24h
+LINK_CACHE_TTL_SECONDS = 24 * 60 * 60
+LINK_CACHE_MAX_ENTRIES = 1024
+_link_cache: TTLCache[dict] = TTLCache(
+    max_entries=LINK_CACHE_MAX_ENTRIES,
+    ttl_seconds=LINK_CACHE_TTL_SECONDS
+)
+
+
+def _link_cache_key(url: str) -> str:
+    """Hash the URL into a fixed-size cache key"""
+    return hashlib.sha256(url.strip().encode("utf-8")).hexdigest()
+
+
+def _finish_extraction(key: str, future: "asyncio.Future") -> None:
+    """
+    Done-callback for an extraction running in the executor: frees its concurrency
+    slot and caches a successful result, including one that arrives after the caller
+    timed out. Failures aren't cached so a flaky site gets retried next time.
+    """
+    _EXTRACTION_SEMAPHORE.release()
+    if future.cancelled() or future.exception() is not None:
+        return
+    extraction_result = future.result()
+    if extraction_result:
+        _link_cache.set(key, extraction_result)
+
 
 def _is_render_environment():
     """Detecta se está rodando no Render."""
@@ -60,25 +126,26 @@ def _is_render_environment():
     )
 
 
+@lru_cache(maxsize=None)
 def _is_selenium_available():
-    """Verifica se Selenium está disponível e funcionando."""
+    """
+    Verifica se Selenium está disponível e funcionando.
+    O resultado é cacheado: o Chrome instalado não muda durante a vida do processo.
+    """
     if not SELENIUM_AVAILABLE:
         return False
     
-    # Verifica se Chrome/Chromium está disponível
+    # Verifica se Chrome/Chromium está disponível (chromium como fallback);
+    # shutil.which só consulta o PATH, sem criar processo
+    chrome = shutil.which('google-chrome') or shutil.which('chromium-browser')
+    if chrome is None:
+        return False
     try:
-        import subprocess
-        result = subprocess.run(['google-chrome', '--version'], 
-                              capture_output=True, text=True, timeout=5)
+        result = subprocess.run([chrome, '--version'],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
         return result.returncode == 0
-    except:
-        try:
-            # Tenta chromium como fallback
-            result = subprocess.run(['chromium-browser', '--version'], 
-                                  capture_output=True, text=True, timeout=5)
-            return result.returncode == 0
-        except:
-            return False
+    except Exception:
+        return False
 
 
 def _is_invalid_content(texto):
@@ -169,10 +236,39 @@ def _is_invalid_content(texto):
     return False
 
 
-def _extrair_com_trafilatura(url):
+# Cabeçalhos de navegador usados nos downloads HTTP simples
+_HEADERS_NAVEGADOR = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+
+def _baixar_html(url):
+    """
+    Baixa o HTML da página uma única vez para todos os métodos rápidos.
+    Retorna None se o download falhar; nesse caso cada método tenta baixar por conta própria.
+    """
+    try:
+        response = _get_http_session().get(url, headers=_HEADERS_NAVEGADOR, timeout=15)
+        if response.status_code == 200:
+            # Sem charset no Content-Type o requests assume ISO-8859-1 para text/html,
+            # o que estraga páginas UTF-8 ("NotÃ­cia"); nesse caso detecta pelo conteúdo
+            if "charset" not in response.headers.get("Content-Type", "").lower():
+                response.encoding = response.apparent_encoding
+            return response.text
+    except Exception as e:
+        logger.debug(f"Download compartilhado falhou para {url}: {e}")
+    return None
+
+
+def _extrair_com_trafilatura(url, html=None):
     """Método 1: Trafilatura (muito robusto)"""
     try:
-        downloaded = trafilatura.fetch_url(url)
+        downloaded = html if html is not None else trafilatura.fetch_url(url)
         if downloaded:
             content = trafilatura.extract(downloaded, include_comments=False, include_tables=True)
             metadata = trafilatura.extract_metadata(downloaded)
@@ -188,7 +284,7 @@ def _extrair_com_trafilatura(url):
     return None
 
 
-def _extrair_com_newspaper3k(url):
+def _extrair_com_newspaper3k(url, html=None):
     """Método 2: Newspaper3k (especializado em notícias)"""
     try:
         config = Config()
@@ -196,7 +292,7 @@ def _extrair_com_newspaper3k(url):
         config.request_timeout = 10
         
         artigo = Article(url, language='pt', config=config)
-        artigo.download()
+        artigo.download(input_html=html)
         artigo.parse()
         
         return {
@@ -210,25 +306,19 @@ def _extrair_com_newspaper3k(url):
     return None
 
 
-def _extrair_com_readability(url):
+def _extrair_com_readability(url, html=None):
     """Método 3: Readability-lxml (focado em conteúdo principal)"""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
-        response = requests.get(url, headers=headers, timeout=15)
+        if html is None:
+            response = _get_http_session().get(url, headers=_HEADERS_NAVEGADOR, timeout=15)
+            html = response.text if response.status_code == 200 else None
         
-        if response.status_code == 200:
-            doc = Document(response.text)
-            soup = BeautifulSoup(doc.summary(), 'html.parser')
+        if html is not None:
+            doc = Document(html)
+            soup = BeautifulSoup(doc.summary(), _HTML_PARSER)
             
             # Extrair título da página original
-            title_soup = BeautifulSoup(response.text, 'html.parser')
+            title_soup = BeautifulSoup(html, _HTML_PARSER)
             title = title_soup.find('title')
             title_text = title.get_text().strip() if title else None
             
@@ -243,11 +333,11 @@ def _extrair_com_readability(url):
     return None
 
 
-def _extrair_com_goose3(url):
+def _extrair_com_goose3(url, html=None):
     """Método 4: Goose3 (especializado em notícias)"""
     try:
         g = Goose()
-        article = g.extract(url=url)
+        article = g.extract(url=url, raw_html=html)
         
         return {
             "titulo": article.title,
@@ -260,8 +350,11 @@ def _extrair_com_goose3(url):
     return None
 
 
-def _extrair_com_requests_session(url):
-    """Método 5: Requests com sessão (para sites que requerem cookies)"""
+def _extrair_com_requests_session(url, html=None):
+    """
+    Método 5: Requests com sessão (para sites que requerem cookies)
+    Sempre baixa a página com a própria sessão; o HTML compartilhado é ignorado.
+    """
     try:
         session = requests.Session()
         headers = {
@@ -283,7 +376,7 @@ def _extrair_com_requests_session(url):
         response = session.get(url, timeout=15, allow_redirects=True)
         
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, _HTML_PARSER)
             
             # Remove scripts e estilos
             for script in soup(["script", "style", "nav", "header", "footer", "aside"]):
@@ -334,21 +427,15 @@ def _extrair_com_requests_session(url):
     return None
 
 
-def _extrair_com_beautifulsoup(url):
+def _extrair_com_beautifulsoup(url, html=None):
     """Método 6: BeautifulSoup (último recurso)"""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
-        response = requests.get(url, headers=headers, timeout=15)
+        if html is None:
+            response = _get_http_session().get(url, headers=_HEADERS_NAVEGADOR, timeout=15)
+            html = response.text if response.status_code == 200 else None
         
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
+        if html is not None:
+            soup = BeautifulSoup(html, _HTML_PARSER)
             
             # Remove scripts e estilos
             for script in soup(["script", "style", "nav", "header", "footer", "aside"]):
@@ -388,6 +475,95 @@ def _extrair_com_beautifulsoup(url):
     return None
 
 
+def _criar_driver_chrome():
+    """Cria um Chrome headless com as opções do método Selenium básico"""
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-web-security")
+    chrome_options.add_argument("--allow-running-insecure-content")
+    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    # Só o texto interessa: não baixa nem decodifica imagens
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    
+    # Configurações específicas para ambiente containerizado
+    # (sem --remote-debugging-port fixa: o driver do pool fica vivo e colidiria
+    # com o Chrome do método avançado; o chromedriver escolhe uma porta livre)
+    if _is_render_environment():
+        chrome_options.add_argument("--disable-background-timer-throttling")
+        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+        chrome_options.add_argument("--disable-renderer-backgrounding")
+    
+    # Tenta usar ChromeDriver do sistema primeiro, depois webdriver-manager
+    try:
+        service = Service('/usr/local/bin/chromedriver')
+        return webdriver.Chrome(service=service, options=chrome_options)
+    except:
+        service = Service(ChromeDriverManager().install())
+        return webdriver.Chrome(service=service, options=chrome_options)
+
+
+class _ChromeDriverPool:
+    """
+    Pool of warm headless Chrome drivers for the basic Selenium method.
+    
+    Starting Chrome costs 1-2s and ~150MB per URL; pooled drivers are reset to
+    about:blank (cookies cleared) and reused. A driver that fails mid-extraction
+    is discarded instead of being returned to the pool.
+    """
+    
+    def __init__(self, size: int):
+        self._idle: "queue.LifoQueue" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+    
+    @contextmanager
+    def driver(self):
+        with self._slots:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                driver = _criar_driver_chrome()
+            
+            healthy = False
+            try:
+                yield driver
+                healthy = True
+            finally:
+                if healthy:
+                    try:
+                        driver.delete_all_cookies()
+                        driver.get("about:blank")
+                        self._idle.put(driver)
+                    except Exception:
+                        driver.quit()
+                else:
+                    driver.quit()
+    
+    def close(self):
+        """Quit every idle driver (called at interpreter exit)."""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+@lru_cache()
+def _get_chrome_driver_pool() -> _ChromeDriverPool:
+    """Create the driver pool on first use; only one warm driver on Render, where memory is tight."""
+    pool = _ChromeDriverPool(size=1 if _is_render_environment() else 2)
+    atexit.register(pool.close)
+    return pool
+
+
 def _extrair_com_selenium(url):
     """Método 7: Selenium (para sites com JavaScript)"""
     if not SELENIUM_AVAILABLE:
@@ -399,32 +575,7 @@ def _extrair_com_selenium(url):
         return None
         
     try:
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-web-security")
-        chrome_options.add_argument("--allow-running-insecure-content")
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        
-        # Configurações específicas para ambiente containerizado
-        if _is_render_environment():
-            chrome_options.add_argument("--remote-debugging-port=9222")
-            chrome_options.add_argument("--disable-background-timer-throttling")
-            chrome_options.add_argument("--disable-backgrounding-occluded-windows")
-            chrome_options.add_argument("--disable-renderer-backgrounding")
-        
-        # Tenta usar ChromeDriver do sistema primeiro, depois webdriver-manager
-        try:
-            service = Service('/usr/local/bin/chromedriver')
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-        except:
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-        
-        try:
+        with _get_chrome_driver_pool().driver() as driver:
             driver.get(url)
             time.sleep(3)  # Aguarda carregar
             
@@ -453,9 +604,6 @@ def _extrair_com_selenium(url):
                 "data_publicacao": None,
                 "texto_completo": content
             }
-            
-        finally:
-            driver.quit()
     except Exception as e:
         logger.debug(f"Selenium extraction failed for {url}: {e}")
     return None
@@ -490,7 +638,6 @@ def _extrair_com_selenium_avancado(url):
         
         # Configurações específicas para ambiente containerizado
         if _is_render_environment():
-            chrome_options.add_argument("--remote-debugging-port=9222")
             chrome_options.add_argument("--disable-background-timer-throttling")
             chrome_options.add_argument("--disable-backgrounding-occluded-windows")
             chrome_options.add_argument("--disable-renderer-backgrounding")
@@ -607,11 +754,14 @@ def extrair_noticia_principal_de_link(url):
     
     logger.debug(f"🚀 FASE 1: Tentando métodos rápidos para {url}")
     
+    # A página é baixada uma vez e o mesmo HTML alimenta todos os métodos rápidos
+    html = _baixar_html(url)
+    
     # Tenta métodos rápidos primeiro
     for nome_metodo, funcao_metodo in metodos_rapidos:
         try:
             logger.debug(f"Tentando extrair com {nome_metodo}...")
-            resultado = funcao_metodo(url)
+            resultado = funcao_metodo(url, html)
             
             if resultado and resultado.get('texto_completo'):
                 texto = resultado['texto_completo'].strip()
@@ -693,33 +843,63 @@ class LinkEnricher:
         """
         start_time = time.time()
         
-        enriched_claims = []
-        total_links = 0
-        successful_extractions = 0
+        enriched_claims = [claim async for claim in self.enrich_links_stream(claims_result)]
+        
+        processing_time = int((time.time() - start_time) * 1000)
+        return self.summarize_enrichment(claims_result, enriched_claims, processing_time)
+
+    async def enrich_links_stream(self, claims_result: ClaimExtractionResult) -> AsyncIterator[EnrichedClaim]:
+        """
+        Enrich claims one at a time, yielding each EnrichedClaim (in input order) as soon as it is ready.
         
+        Args:
+            claims_result: Result from claim extraction step
+            
+        Yields:
+            EnrichedClaim for each extracted claim
+        """
+        # Start every link extraction up front (one task per unique URL) so all links
+        # are fetched concurrently; claims are still yielded in input order
+        link_tasks: Dict[str, asyncio.Task] = {}
         for claim in claims_result.claims:
-            if claim.links:
-                total_links += len(claim.links)
-                enriched_claim = await self._enrich_single_claim(claim)
-                
-                # Count successful extractions
-                for enriched_link in enriched_claim.enriched_links:
-                    if enriched_link.extraction_status == "success":
-                        successful_extractions += 1
-                        
-                enriched_claims.append(enriched_claim)
-            else:
-                # No links to enrich, convert to EnrichedClaim as-is
-                enriched_claim = EnrichedClaim(
-                    text=claim.text,
-                    original_links=[],
-                    enriched_links=[],
-                    llm_comment=claim.llm_comment,
-                    entities=claim.entities
-                )
-                enriched_claims.append(enriched_claim)
+            for url in claim.links:
+                if url not in link_tasks:
+                    link_tasks[url] = asyncio.ensure_future(self._extract_link_content(url))
         
-        processing_time = int((time.time() - start_time) * 1000)
+        try:
+            for claim in claims_result.claims:
+                if claim.links:
+                    yield await self._enrich_single_claim(claim, link_tasks)
+                else:
+                    # No links to enrich, convert to EnrichedClaim as-is
+                    yield EnrichedClaim(
+                        text=claim.text,
+                        original_links=[],
+                        enriched_links=[],
+                        llm_comment=claim.llm_comment,
+                        entities=claim.entities
+                    )
+        finally:
+            # Consumer stopped early: don't leave extractions running for nobody
+            for task in link_tasks.values():
+                task.cancel()
+
+    def summarize_enrichment(
+        self,
+        claims_result: ClaimExtractionResult,
+        enriched_claims: List[EnrichedClaim],
+        processing_time_ms: int
+    ) -> LinkEnrichmentResult:
+        """Build the LinkEnrichmentResult (link counts and notes) for already enriched claims."""
+        total_links = sum(len(claim.links) for claim in claims_result.claims)
+        
+        # Count successful extractions
+        successful_extractions = sum(
+            1
+            for enriched_claim in enriched_claims
+            for enriched_link in enriched_claim.enriched_links
+            if enriched_link.extraction_status == "success"
+        )
         
         processing_notes = (
             f"Processados {total_links} links. "
@@ -732,19 +912,14 @@ class LinkEnricher:
             enriched_claims=enriched_claims,
             total_links_processed=total_links,
             successful_extractions=successful_extractions,
-            processing_time_ms=processing_time,
+            processing_time_ms=processing_time_ms,
             processing_notes=processing_notes
         )
 
-    async def _enrich_single_claim(self, claim: ExtractedClaim) -> EnrichedClaim:
-        """Enrich a single claim by extracting content from its links."""
-        
-        enriched_links = []
+    async def _enrich_single_claim(self, claim: ExtractedClaim, link_tasks: Dict[str, asyncio.Task]) -> EnrichedClaim:
+        """Enrich a single claim by awaiting the (already running) extractions of its links."""
         
-        # Process each link in the claim
-        for url in claim.links:
-            enriched_link = await self._extract_link_content(url)
-            enriched_links.append(enriched_link)
+        enriched_links = list(await asyncio.gather(*(link_tasks[url] for url in claim.links)))
         
         return EnrichedClaim(
             text=claim.text,
@@ -772,12 +947,21 @@ class LinkEnricher:
         try:
             # Use asyncio to run newspaper3k extraction in thread pool
             # (newspaper3k is synchronous, so we need to wrap it)
-            loop = asyncio.get_event_loop()
-            extraction_result = await loop.run_in_executor(
-                None, 
-                self._extract_with_newspaper, 
-                url
-            )
+            cache_key = _link_cache_key(url)
+            extraction_result = _link_cache.get(cache_key)
+            if extraction_result is None:
+                loop = asyncio.get_running_loop()
+                await _EXTRACTION_SEMAPHORE.acquire()
+                future = loop.run_in_executor(None, self._extract_with_newspaper, url)
+                # The worker thread can't be interrupted, so the slot is released (and the
+                # result cached) only when it really finishes, even after we stop waiting
+                future.add_done_callback(partial(_finish_extraction, cache_key))
+                extraction_result = await asyncio.wait_for(
+                    asyncio.shield(future),
+                    timeout=settings.LINK_EXTRACTION_TIMEOUT
+                )
+            else:
+                logger.debug(f"Using cached extraction for {url}")
             
             if extraction_result:
                 enriched_link.title = extraction_result.get("titulo", "")
@@ -799,6 +983,11 @@ class LinkEnricher:
                 enriched_link.extraction_status = "failed"
                 enriched_link.extraction_notes = "Falha na extração de conteúdo"
                 
+        except asyncio.TimeoutError:
+            logger.warning(f"Link enrichment timed out for {url}")
+            enriched_link.extraction_status = "timeout"
+            enriched_link.extraction_notes = f"Extração excedeu {settings.LINK_EXTRACTION_TIMEOUT}s"
+            
         except Exception as e:
             logger.error(f"Link enrichment failed for {url}: {e}")
             enriched_link.extraction_status = "failed"
@@ -848,8 +1037,9 @@ class LinkEnricher:
         if title:
             summary_parts.append(f"Título: {title}")
         
-        # Get first paragraph (up to first double newline or first 200 chars)
-        first_paragraph = content.split('\n\n')[0] if '\n\n' in content else content
+        # Get first paragraph (up to first double newline or first 200 chars);
+        # partition stops at the first separator instead of splitting the whole text
+        first_paragraph = content.partition('\n\n')[0]
         first_paragraph = first_paragraph[:200] + "..." if len(first_paragraph) > 200 else first_paragraph
         
         if first_paragraph.strip():
@@ -859,9 +1049,11 @@ class LinkEnricher:
 
 
 # Factory function for creating enricher
+@lru_cache()
 def create_link_enricher(content_limit: int = 5000) -> LinkEnricher:
     """
     Factory function to create a LinkEnricher instance.
+    Cached per content_limit since the enricher holds no per-request state.
     """
     return LinkEnricher(content_limit=content_limit)
 
@@ -0,0 +1,113 @@
+"""
+Known Claims Module - Pipeline Shortcut after Claim Extraction
+
+Keeps a small curated set of already debunked claims (app/ai/data/known_claims.json)
+with canonical verdicts and sources. When every extracted claim matches a known
+claim, the pipeline answers from this set and skips link enrichment, evidence
+retrieval and adjudication.
+
+Those answers reach users without the adjudicator's evidence check, so every entry
+must cite a real, checked URL with a verbatim quote from it. The file ships empty
+until someone curates it; with no entries the shortcut never fires.
+
+Matching is exact on normalized text (case, whitespace and trailing punctuation),
+against the canonical claim text and a curated list of aliases. Fuzzy similarity is
+deliberately not used: "Vacinas não causam autismo" is one word away from
+"Vacinas causam autismo" but has the opposite meaning, and a shortcut answer is
+never reviewed by the adjudicator.
+"""
+
+import os
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from pydantic import TypeAdapter
+
+from app.models.factchecking import ExtractedClaim, KnownClaim
+
+KNOWN_CLAIMS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "known_claims.json")
+
+# Parses and validates the whole file in one pydantic-core pass
+_KNOWN_CLAIMS_ADAPTER = TypeAdapter(List[KnownClaim])
+
+
+def _normalize(text: str) -> str:
+    """Lowercase and collapse whitespace/trailing punctuation for comparison"""
+    return " ".join(text.lower().split()).rstrip(".!?")
+
+
+@lru_cache()
+def load_known_claims() -> Dict[str, KnownClaim]:
+    """Load the known claims file once, indexed by the normalized claim text and each alias"""
+    try:
+        with open(KNOWN_CLAIMS_PATH, "rb") as f:
+            known_claims = _KNOWN_CLAIMS_ADAPTER.validate_json(f.read())
+    except FileNotFoundError:
+        return {}
+
+    index = {}
+    for known in known_claims:
+        for text in (known.claim_text, *known.aliases):
+            index[_normalize(text)] = known
+    return index
+
+
+def match_known_claim(claim_text: str) -> Optional[KnownClaim]:
+    """
+    Find the known claim whose text (or one of its aliases) equals claim_text after normalization.
+
+    Args:
+        claim_text: Claim text as produced by the claim extractor
+
+    Returns:
+        The matching KnownClaim, or None
+    """
+    return load_known_claims().get(_normalize(claim_text))
+
+
+def match_all_known_claims(claims: List[ExtractedClaim]) -> Optional[List[KnownClaim]]:
+    """
+    Match every claim against the known set.
+
+    Claims with links are never shortcut, since the linked content may change the verdict.
+
+    Returns:
+        One KnownClaim per claim if all of them match, otherwise None
+    """
+    if not claims:
+        return None
+
+    matches = []
+    for claim in claims:
+        if claim.links:
+            return None
+        known = match_known_claim(claim.text)
+        if known is None:
+            return None
+        matches.append(known)
+
+    return matches
+
+
+def build_known_claims_analysis(claims: List[ExtractedClaim], matches: List[KnownClaim]) -> str:
+    """Render matched known claims in the same text format the adjudicator produces"""
+    intro = " ".join(known.rationale for known in matches)
+
+    lines = [
+        "O texto contém alegações que já foram verificadas anteriormente por fontes confiáveis. " + intro,
+        "",
+        "Análise por alegação:",
+    ]
+    for claim, known in zip(claims, matches):
+        lines.append(f"• {claim.text}: {known.verdict}")
+
+    lines.extend(["", "Fontes de apoio:"])
+    seen_urls = set()
+    for known in matches:
+        for citation in known.citations:
+            if citation.url in seen_urls:
+                continue
+            seen_urls.add(citation.url)
+            lines.append(f"- {citation.publisher}: \"{citation.quoted}\" ({citation.url})")
+
+    return "\n".join(lines)
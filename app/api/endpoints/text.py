@@ -1,60 +1,114 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Header
+from fastapi.responses import Response, StreamingResponse
+import asyncio
 import time
-import json
 import os
-from datetime import datetime
+import logging
+import orjson
+from typing import Optional
 from app.models.schemas import TextRequest, AnalysisResponse
-from app.ai.pipeline import process_text_request, test_adjudicator, test_evidence_retrieval, test_full_pipeline_steps_1_3_4
+from app.ai.pipeline import dump_timestamp, stream_text_request
+from app.ai.cache import get_response_cache
+from app.core.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# testoutput directory at the project root, resolved once at import
+_OUTPUT_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))),
+    "testoutput"
+)
 
 router = APIRouter()
 
 
 @router.post("/text", response_model=AnalysisResponse)
-async def analyze_text(request: TextRequest) -> AnalysisResponse:
+async def analyze_text(request: TextRequest, cache_control: Optional[str] = Header(None)) -> Response:
     """
-    Analyze text-only messages for fact-checking
+    Analyze text-only messages for fact-checking.
+    Repeated texts are answered from the response cache unless the
+    request sends "Cache-Control: no-cache".
     """
     try:
-        return await process_text_request(request)
+        use_cache = not (cache_control and "no-cache" in cache_control.lower())
+        cache = get_response_cache()
+        cache_key = cache.make_key(request.text)
+        
+        if use_cache:
+            cached_response = cache.get(cache_key)
+            if cached_response is not None:
+                return _json_response(cached_response)
+        
+        response = None
+        complete = True
+        async for stage, payload in stream_text_request(request):
+            if stage == "evidence" and payload.lookup_failed:
+                complete = False
+            elif stage == "result":
+                response = payload
+        
+        # Only analyses where every stage succeeded are cached; errors and runs with a
+        # failed fact-check lookup go through the pipeline again on the next attempt
+        if complete and response.verdict != "error":
+            cache.set(cache_key, response)
+        
+        return _json_response(response)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Processing error: {str(e)}")
 
 
-@router.get("/test-adjudicator")
-async def test_adjudicator_endpoint():
+@router.post("/text/stream")
+async def analyze_text_stream(request: TextRequest) -> StreamingResponse:
     """
-    Test endpoint for the adjudicator with hard-coded realistic data
+    Analyze text-only messages, streaming each pipeline stage as NDJSON:
+    the extracted claims, one line per claim's evidence, then the final AnalysisResponse
     """
-    try:
-        result = await test_adjudicator()
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Test error: {str(e)}")
+    async def generate():
+        async for stage, payload in stream_text_request(request):
+            # The payload is serialized by pydantic-core straight to JSON and spliced in
+            yield b'{"stage":' + orjson.dumps(stage) + b',"data":' + payload.model_dump_json().encode() + b"}\n"
 
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
-@router.get("/test-evidence-retrieval")
-async def test_evidence_retrieval_endpoint():
-    """
-    Test endpoint for evidence retrieval (Step 3) using Google Fact-Check API
-    """
-    try:
-        result = await test_evidence_retrieval()
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Evidence retrieval test error: {str(e)}")
 
+# Smoke-test endpoints backed by hard-coded pipeline runs (DEBUG only)
+if settings.DEBUG:
+    from app.ai.pipeline_smoke import test_adjudicator, test_evidence_retrieval, test_full_pipeline_steps_1_3_4
 
-@router.get("/test-full-pipeline")
-async def test_full_pipeline_endpoint():
-    """
-    Test endpoint for complete pipeline: Claim Extraction -> Evidence Retrieval -> Adjudication
-    This shows what the adjudicator LLM actually returns when given real Google API evidence.
-    """
-    try:
-        result = await test_full_pipeline_steps_1_3_4()
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Full pipeline test error: {str(e)}")
+    @router.get("/test-adjudicator")
+    async def test_adjudicator_endpoint():
+        """
+        Test endpoint for the adjudicator with hard-coded realistic data
+        """
+        try:
+            result = await test_adjudicator()
+            return result
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Test error: {str(e)}")
+
+    @router.get("/test-evidence-retrieval")
+    async def test_evidence_retrieval_endpoint():
+        """
+        Test endpoint for evidence retrieval (Step 3) using Google Fact-Check API
+        """
+        try:
+            result = await test_evidence_retrieval()
+            return result
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Evidence retrieval test error: {str(e)}")
+
+    @router.get("/test-full-pipeline")
+    async def test_full_pipeline_endpoint():
+        """
+        Test endpoint for complete pipeline: Claim Extraction -> Evidence Retrieval -> Adjudication
+        This shows what the adjudicator LLM actually returns when given real Google API evidence.
+        """
+        try:
+            result = await test_full_pipeline_steps_1_3_4()
+            return result
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Full pipeline test error: {str(e)}")
 
 
 @router.get("/test-claims-with-urls")
@@ -108,13 +162,7 @@ async def test_link_enrichment_endpoint(url: str = None):
         from app.ai.factchecking.link_enricher import create_link_enricher
         
         start_time = time.time()
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Get the project root directory
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
-        output_dir = os.path.join(project_root, "testoutput")
-        os.makedirs(output_dir, exist_ok=True)
+        timestamp = dump_timestamp()
         
         # Create test claims with real URLs for testing
         if url:
@@ -156,49 +204,88 @@ async def test_link_enrichment_endpoint(url: str = None):
             processing_notes="Teste de enriquecimento de links"
         )
         
-        # Test link enrichment
+        # Test link enrichment, streaming each claim to the client as soon as it is enriched
         link_enricher = create_link_enricher()
-        enrichment_result = await link_enricher.enrich_links(claims_result)
-        
-        # Save Step 2.5 output to file
-        step25_output = {
-            "timestamp": timestamp,
-            "step": "2.5_link_enrichment",
-            "input": claims_result.dict(),
-            "output": enrichment_result.dict(),
-            "processing_time_ms": int((time.time() - start_time) * 1000)
-        }
+        filename = f"step25_link_enrichment_{timestamp}.json"
         
-        with open(f"{output_dir}/step25_link_enrichment_{timestamp}.json", "w", encoding="utf-8") as f:
-            json.dump(step25_output, f, indent=2, ensure_ascii=False)
+        async def generate():
+            yield b'{"success":true,"timestamp":' + orjson.dumps(timestamp) + b',"enriched_claims":['
+            
+            enriched_claims = []
+            async for claim in link_enricher.enrich_links_stream(claims_result):
+                if enriched_claims:
+                    yield b","
+                enriched_claims.append(claim)
+                yield orjson.dumps(_summarize_enriched_claim(claim))
+            
+            processing_time_ms = int((time.time() - start_time) * 1000)
+            enrichment_result = link_enricher.summarize_enrichment(claims_result, enriched_claims, processing_time_ms)
+            
+            # Save Step 2.5 output to file
+            step25_output = {
+                "timestamp": timestamp,
+                "step": "2.5_link_enrichment",
+                "input": claims_result.model_dump(),
+                "output": enrichment_result.model_dump(),
+                "processing_time_ms": processing_time_ms
+            }
+            
+            # The response is already under way, so a failed dump is reported in the payload.
+            # Disk I/O runs on a worker thread to keep the event loop free for other requests
+            try:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, _write_json_dump, filename, step25_output
+                )
+                file_saved = filename
+            except OSError as e:
+                logger.error(f"Failed to save link enrichment dump: {e}")
+                file_saved = None
+            
+            # Close the array and append the aggregate fields to the same object
+            yield b"]," + orjson.dumps({
+                "file_saved": file_saved,
+                "total_links_processed": enrichment_result.total_links_processed,
+                "successful_extractions": enrichment_result.successful_extractions,
+                "processing_time_ms": enrichment_result.processing_time_ms,
+                "processing_notes": enrichment_result.processing_notes
+            })[1:]
         
-        return {
-            "success": True,
-            "timestamp": timestamp,
-            "file_saved": f"step25_link_enrichment_{timestamp}.json",
-            "total_links_processed": enrichment_result.total_links_processed,
-            "successful_extractions": enrichment_result.successful_extractions,
-            "processing_time_ms": enrichment_result.processing_time_ms,
-            "processing_notes": enrichment_result.processing_notes,
-            "enriched_claims": [
-                {
-                    "text": claim.text,
-                    "original_links": claim.original_links,
-                    "enriched_links": [
-                        {
-                            "url": link.url,
-                            "title": link.title,
-                            "content_length": len(link.content),
-                            "summary": link.summary,
-                            "extraction_status": link.extraction_status,
-                            "extraction_notes": link.extraction_notes
-                        } for link in claim.enriched_links
-                    ],
-                    "llm_comment": claim.llm_comment,
-                    "entities": claim.entities
-                } for claim in enrichment_result.enriched_claims
-            ]
-        }
+        return StreamingResponse(generate(), media_type="application/json")
         
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Link enrichment test error: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Link enrichment test error: {str(e)}")
+
+
+def _json_response(response: AnalysisResponse) -> Response:
+    """
+    Serialize an AnalysisResponse in one pydantic-core pass.
+    Returning a Response skips FastAPI's response_model re-validation and jsonable_encoder walk.
+    """
+    return Response(content=response.model_dump_json(), media_type="application/json")
+
+
+def _summarize_enriched_claim(claim) -> dict:
+    """Compact view of an enriched claim for the link enrichment test response (content length instead of content)"""
+    return {
+        "text": claim.text,
+        "original_links": claim.original_links,
+        "enriched_links": [
+            {
+                "url": link.url,
+                "title": link.title,
+                "content_length": len(link.content),
+                "summary": link.summary,
+                "extraction_status": link.extraction_status,
+                "extraction_notes": link.extraction_notes
+            } for link in claim.enriched_links
+        ],
+        "llm_comment": claim.llm_comment,
+        "entities": claim.entities
+    }
+
+
+def _write_json_dump(filename: str, data: dict) -> None:
+    """Write a pretty-printed JSON dump into testoutput/ (blocking; run it off the event loop)."""
+    os.makedirs(_OUTPUT_DIR, exist_ok=True)
+    with open(os.path.join(_OUTPUT_DIR, filename), "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
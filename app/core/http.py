@@ -0,0 +1,26 @@
+from functools import lru_cache
+
+import httpx
+
+
+@lru_cache()
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Shared async HTTP client for outbound API calls.
+
+    One pooled client for the whole process, so calls reuse keep-alive
+    connections (and multiplex over HTTP/2 where the host supports it)
+    instead of paying a TCP/TLS handshake each time. Closed on app shutdown.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=10,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+    )
+
+
+async def close_http_client() -> None:
+    """Close the shared client if it was ever created."""
+    if get_http_client.cache_info().currsize:
+        await get_http_client().aclose()
+        get_http_client.cache_clear()
@@ -0,0 +1,44 @@
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from app.core.config import get_settings
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging() -> None:
+    """
+    Route the app's loggers through a queue drained by a background thread.
+
+    Request handlers only enqueue the record; formatting and writing to stderr
+    happen on the listener thread, so logging never blocks the event loop.
+    Safe to call more than once (e.g. on --reload).
+
+    Levels match the unconfigured default (WARNING and above) unless DEBUG is
+    set, so info logs that carry users' claim text stay off in production.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue: queue.Queue = queue.Queue(-1)
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    # Only the "app" package logger, so library and uvicorn logging stay as they are
+    app_logger = logging.getLogger("app")
+    app_logger.setLevel(logging.DEBUG if get_settings().DEBUG else logging.WARNING)
+    app_logger.addHandler(QueueHandler(log_queue))
+    app_logger.propagate = False
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    # Flush whatever is still queued when the process exits
+    atexit.register(_listener.stop)
@@ -1,15 +1,21 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.endpoints import text, images, multimodal
 from app.core.config import get_settings
+from app.core.logging import setup_logging
+from app.core.http import close_http_client
+from app.ai.cache import get_response_cache
 
 settings = get_settings()
+setup_logging()
 
 app = FastAPI(
     title="Fake News Detector API",
     description="WhatsApp chatbot backend for fact-checking and claim verification",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 app.add_middleware(
@@ -25,6 +31,11 @@ app.include_router(images.router, prefix="/api", tags=["images"])
 app.include_router(multimodal.router, prefix="/api", tags=["multimodal"])
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    await close_http_client()
+
+
 @app.get("/")
 async def root():
     return {"message": "Fake News Detector API", "version": "1.0.0"}
@@ -32,4 +43,4 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy", "response_cache": get_response_cache().stats()}
\ No newline at end of file
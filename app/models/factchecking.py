@@ -165,6 +165,7 @@ class ClaimEvidence(BaseModel):
     search_queries: List[str] = Field(default_factory=list, description="Queries used to find evidence")
     enriched_links: List[EnrichedLink] = Field(default_factory=list, description="Enriched links from the claim")
     retrieval_notes: Optional[str] = Field(None, description="Notes about the evidence retrieval process")
+    lookup_failed: bool = Field(default=False, description="True if the fact-check lookup failed (as opposed to finding nothing)")
 
     class Config:
         json_schema_extra = {
@@ -250,6 +251,34 @@ class FactCheckResult(BaseModel):
         }
 
 
+# ===== KNOWN CLAIMS SHORTCUT =====
+class KnownClaim(BaseModel):
+    """A previously debunked claim with its canonical verdict and sources"""
+    claim_text: str = Field(..., description="Canonical text of the known claim")
+    aliases: List[str] = Field(default_factory=list, description="Curated alternative wordings that mean exactly the same claim")
+    verdict: str = Field(..., description="Verdict in uppercase: VERDADEIRO, FALSO, ENGANOSO or NÃO VERIFICÁVEL")
+    rationale: str = Field(..., description="Short explanation of the verdict")
+    citations: List[Citation] = Field(default_factory=list, description="Sources backing the verdict")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "claim_text": "Vacinas causam autismo",
+                "aliases": ["Vacina causa autismo"],
+                "verdict": "FALSO",
+                "rationale": "Estudos com milhões de crianças não encontraram relação entre vacinas e autismo.",
+                "citations": [
+                    {
+                        "url": "https://health.example.gov/vaccines-autism",
+                        "title": "Vaccine Safety Review",
+                        "publisher": "Ministry of Health",
+                        "quoted": "Verbatim excerpt copied from the source page"
+                    }
+                ]
+            }
+        }
+
+
 # ===== PIPELINE FLOW SUMMARY =====
 """
 Updated Pipeline Flow (5 Steps):
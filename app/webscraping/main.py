@@ -47,19 +47,20 @@ def extrair_noticia_principal_de_link(url):
 
 # --- Exemplo Prático de Uso ---
 
-# Um link de notícia qualquer
-link_da_noticia = "https://noticias.uol.com.br/politica/ultimas-noticias/2025/09/20/flavio-bolsonaro-defende-anistia-pec-da-blindagem-de-pec-da-sobrevivencia.htm"
+if __name__ == "__main__":
+    # Um link de notícia qualquer
+    link_da_noticia = "https://noticias.uol.com.br/politica/ultimas-noticias/2025/09/20/flavio-bolsonaro-defende-anistia-pec-da-blindagem-de-pec-da-sobrevivencia.htm"
 
-# Chama a função
-dados_da_noticia = extrair_noticia_principal_de_link(link_da_noticia)
+    # Chama a função
+    dados_da_noticia = extrair_noticia_principal_de_link(link_da_noticia)
 
-if dados_da_noticia:
-    print("--- INFORMAÇÕES EXTRAÍDAS COM SUCESSO ---")
-    print(f"Título: {dados_da_noticia['titulo']}")
-    print(f"Autores: {dados_da_noticia['autores']}")
-    print(f"Data de Publicação: {dados_da_noticia['data_publicacao']}")
-    print("\n--- TEXTO LIMPO DO ARTIGO ---")
-    print(dados_da_noticia['texto_completo']) # Imprime o texto completo
-    
-    # AGORA VOCÊ PODE USAR ESTE TEXTO LIMPO NA API DO GOOGLE FACT CHECK
-    # query_para_google = f"{dados_da_noticia['titulo']} {dados_da_noticia['texto_completo']}"
\ No newline at end of file
+    if dados_da_noticia:
+        print("--- INFORMAÇÕES EXTRAÍDAS COM SUCESSO ---")
+        print(f"Título: {dados_da_noticia['titulo']}")
+        print(f"Autores: {dados_da_noticia['autores']}")
+        print(f"Data de Publicação: {dados_da_noticia['data_publicacao']}")
+        print("\n--- TEXTO LIMPO DO ARTIGO ---")
+        print(dados_da_noticia['texto_completo']) # Imprime o texto completo
+
+        # AGORA VOCÊ PODE USAR ESTE TEXTO LIMPO NA API DO GOOGLE FACT CHECK
+        # query_para_google = f"{dados_da_noticia['titulo']} {dados_da_noticia['texto_completo']}"
\ No newline at end of file
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Script para testar que o atalho de alegações conhecidas só casa o texto exato
+(ou um alias curado), e nunca uma variação que muda o sentido da alegação.
+Usa um arquivo de alegações de teste, independente do conteúdo curado em app/ai/data.
+"""
+
+import json
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+
+from app.ai import known_claims
+from app.ai.known_claims import match_known_claim
+
+ALEGACOES_TESTE = [
+    {
+        "claim_text": "Vacinas causam autismo",
+        "aliases": ["Vacina causa autismo"],
+        "verdict": "FALSO",
+        "rationale": "Alegação de teste."
+    },
+    {
+        "claim_text": "Pessoas com olhos azuis são mais inteligentes",
+        "verdict": "FALSO",
+        "rationale": "Alegação de teste."
+    }
+]
+
+DEVEM_CASAR = [
+    "Vacinas causam autismo",
+    "vacinas causam autismo.",
+    "Vacina causa autismo",
+    "Pessoas com olhos azuis são mais inteligentes",
+]
+
+NAO_DEVEM_CASAR = [
+    "Vacinas não causam autismo",
+    "Vacinas nunca causam autismo",
+    "Vacinas curam autismo",
+    "Pessoas com olhos azuis não são mais inteligentes",
+]
+
+
+@contextmanager
+def alegacoes_teste():
+    """Aponta o módulo para um arquivo temporário com ALEGACOES_TESTE enquanto durar o bloco"""
+    caminho_original = known_claims.KNOWN_CLAIMS_PATH
+    arquivo = tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8")
+    with arquivo:
+        json.dump(ALEGACOES_TESTE, arquivo, ensure_ascii=False)
+    known_claims.KNOWN_CLAIMS_PATH = arquivo.name
+    known_claims.load_known_claims.cache_clear()
+    try:
+        yield
+    finally:
+        known_claims.KNOWN_CLAIMS_PATH = caminho_original
+        known_claims.load_known_claims.cache_clear()
+        os.unlink(arquivo.name)
+
+
+def test_known_claims_exact_match():
+    with alegacoes_teste():
+        for texto in DEVEM_CASAR:
+            assert match_known_claim(texto) is not None, texto
+
+
+def test_known_claims_negation_not_shortcut():
+    with alegacoes_teste():
+        for texto in NAO_DEVEM_CASAR:
+            assert match_known_claim(texto) is None, texto
+
+
+if __name__ == "__main__":
+    ok = True
+    with alegacoes_teste():
+        for texto in DEVEM_CASAR:
+            casou = match_known_claim(texto) is not None
+            ok &= casou
+            print(f"{'✅' if casou else '❌'} deve casar: {texto}")
+        for texto in NAO_DEVEM_CASAR:
+            casou = match_known_claim(texto) is not None
+            ok &= not casou
+            print(f"{'❌' if casou else '✅'} não deve casar: {texto}")
+    sys.exit(0 if ok else 1)
@@ -5,6 +5,7 @@ Testa a extração de conteúdo de diferentes tipos de URLs
 """
 
 import asyncio
+import io
 import logging
 import sys
 import os
@@ -19,39 +20,39 @@ from app.models.factchecking import ClaimExtractionResult, ExtractedClaim
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def testar_extracao_direta(url):
+def testar_extracao_direta(url, saida=None):
     """Testa a extração direta usando a função extrair_noticia_principal_de_link"""
-    print(f"\n🔍 Testando extração direta para: {url}")
-    print("=" * 60)
+    print(f"\n🔍 Testando extração direta para: {url}", file=saida)
+    print("=" * 60, file=saida)
     
     try:
         dados_da_noticia = extrair_noticia_principal_de_link(url)
         
         if dados_da_noticia:
-            print("\n✅ INFORMAÇÕES EXTRAÍDAS COM SUCESSO!")
-            print(f"📰 Título: {dados_da_noticia['titulo']}")
-            print(f"👤 Autores: {dados_da_noticia['autores']}")
-            print(f"📅 Data de Publicação: {dados_da_noticia['data_publicacao']}")
-            print(f"🔧 Método usado: {dados_da_noticia.get('metodo_usado', 'N/A')}")
-            print(f"📝 Tamanho do texto: {len(dados_da_noticia['texto_completo'])} caracteres")
-            print("\n--- TEXTO LIMPO DO ARTIGO ---")
+            print("\n✅ INFORMAÇÕES EXTRAÍDAS COM SUCESSO!", file=saida)
+            print(f"📰 Título: {dados_da_noticia['titulo']}", file=saida)
+            print(f"👤 Autores: {dados_da_noticia['autores']}", file=saida)
+            print(f"📅 Data de Publicação: {dados_da_noticia['data_publicacao']}", file=saida)
+            print(f"🔧 Método usado: {dados_da_noticia.get('metodo_usado', 'N/A')}", file=saida)
+            print(f"📝 Tamanho do texto: {len(dados_da_noticia['texto_completo'])} caracteres", file=saida)
+            print("\n--- TEXTO LIMPO DO ARTIGO ---", file=saida)
             texto = dados_da_noticia['texto_completo']
             preview = texto[:500] + "..." if len(texto) > 500 else texto
-            print(preview)
+            print(preview, file=saida)
             
             return dados_da_noticia
         else:
-            print("❌ Falha na extração - nenhum método funcionou")
+            print("❌ Falha na extração - nenhum método funcionou", file=saida)
             return None
             
     except Exception as e:
-        print(f"❌ Erro durante extração: {e}")
+        print(f"❌ Erro durante extração: {e}", file=saida)
         return None
 
-async def testar_link_enricher(url):
+async def testar_link_enricher(url, saida=None):
     """Testa o LinkEnricher usando a pipeline completa"""
-    print(f"\n🔍 Testando LinkEnricher para: {url}")
-    print("=" * 60)
+    print(f"\n🔍 Testando LinkEnricher para: {url}", file=saida)
+    print("=" * 60, file=saida)
     
     try:
         # Criar um claim de teste
@@ -72,25 +73,25 @@ async def testar_link_enricher(url):
         enricher = LinkEnricher(content_limit=2000)
         result = await enricher.enrich_links(claims_result)
         
-        print(f"\n✅ RESULTADO DO LINK ENRICHER:")
-        print(f"📊 Total de links processados: {result.total_links_processed}")
-        print(f"✅ Extrações bem-sucedidas: {result.successful_extractions}")
-        print(f"⏱️ Tempo de processamento: {result.processing_time_ms}ms")
-        print(f"📝 Notas: {result.processing_notes}")
+        print(f"\n✅ RESULTADO DO LINK ENRICHER:", file=saida)
+        print(f"📊 Total de links processados: {result.total_links_processed}", file=saida)
+        print(f"✅ Extrações bem-sucedidas: {result.successful_extractions}", file=saida)
+        print(f"⏱️ Tempo de processamento: {result.processing_time_ms}ms", file=saida)
+        print(f"📝 Notas: {result.processing_notes}", file=saida)
         
         for enriched_claim in result.enriched_claims:
             for enriched_link in enriched_claim.enriched_links:
-                print(f"\n🔗 Link: {enriched_link.url}")
-                print(f"📊 Status: {enriched_link.extraction_status}")
-                print(f"📰 Título: {enriched_link.title}")
-                print(f"📝 Resumo: {enriched_link.summary}")
-                print(f"📄 Conteúdo (primeiros 200 chars): {enriched_link.content[:200]}...")
-                print(f"🔧 Notas: {enriched_link.extraction_notes}")
+                print(f"\n🔗 Link: {enriched_link.url}", file=saida)
+                print(f"📊 Status: {enriched_link.extraction_status}", file=saida)
+                print(f"📰 Título: {enriched_link.title}", file=saida)
+                print(f"📝 Resumo: {enriched_link.summary}", file=saida)
+                print(f"📄 Conteúdo (primeiros 200 chars): {enriched_link.content[:200]}...", file=saida)
+                print(f"🔧 Notas: {enriched_link.extraction_notes}", file=saida)
         
         return result
         
     except Exception as e:
-        print(f"❌ Erro durante teste do LinkEnricher: {e}")
+        print(f"❌ Erro durante teste do LinkEnricher: {e}", file=saida)
         return None
 
 async def main():
@@ -121,18 +122,24 @@ async def main():
         "https://www.bbc.com/news/technology-12345678"
     ]
     
-    for i, url in enumerate(urls_teste, 1):
-        print(f"\n🔍 TESTE {i}/{len(urls_teste)}")
+    # Todas as URLs são testadas em paralelo; cada uma acumula seu relatório e o imprime
+    # inteiro ao terminar, para a saída de URLs diferentes não se misturar
+    async def testar_url(i, url):
+        saida = io.StringIO()
+        print(f"\n🔍 TESTE {i}/{len(urls_teste)}", file=saida)
         
-        # Teste 1: Extração direta
-        print("\n--- TESTE 1: EXTRAÇÃO DIRETA ---")
-        testar_extracao_direta(url)
+        # Teste 1: Extração direta (síncrona, roda numa thread para não bloquear o event loop)
+        print("\n--- TESTE 1: EXTRAÇÃO DIRETA ---", file=saida)
+        await asyncio.to_thread(testar_extracao_direta, url, saida)
         
         # Teste 2: LinkEnricher completo
-        print("\n--- TESTE 2: LINK ENRICHER COMPLETO ---")
-        await testar_link_enricher(url)
+        print("\n--- TESTE 2: LINK ENRICHER COMPLETO ---", file=saida)
+        await testar_link_enricher(url, saida)
         
-        print("\n" + "="*80 + "\n")
+        print("\n" + "="*80 + "\n", file=saida)
+        print(saida.getvalue(), end="")
+    
+    await asyncio.gather(*(testar_url(i, url) for i, url in enumerate(urls_teste, 1)))
 
 if __name__ == "__main__":
     asyncio.run(main())